@@ -0,0 +1,51 @@
+"""
+Shared execution window for outbound Google Slides API calls.
+
+Every module that talks to Slides sends its requests through
+execute_slides_request, so one concurrency limit and one retry policy apply
+to the whole process. Presentation reads and the batchUpdates built from
+absolute values (text replacement, text style, ABSOLUTE transforms) are
+retried on 429 and 503; RELATIVE transforms are only retried on 429.
+"""
+
+import logging
+import random
+import threading
+import time
+
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+# Process-wide ceiling on in-flight Slides calls; this is the real quota limit.
+# Each /process request makes its Slides calls one after another, so the API
+# admits the same number of requests (see backend/main.py)
+MAX_CONCURRENT_SLIDES_CALLS = 4
+_SLIDES_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_SLIDES_CALLS)
+RETRYABLE_STATUS_CODES = {429, 503}
+MAX_SLIDES_RETRIES = 5
+
+def execute_slides_request(request, retry_unavailable: bool = True):
+    """
+    Execute a Slides API request inside the shared concurrency window.
+    Rate-limit (429) and unavailable (503) errors are retried with exponential
+    backoff; the wait happens outside the window so other calls keep flowing.
+    
+    A 429 is rejected before the request is applied, so it is always safe to
+    retry. A 503 may arrive after the server applied the request, so callers
+    sending non-idempotent updates (e.g. RELATIVE transforms) must pass
+    retry_unavailable=False. Reads and absolute updates keep the default.
+    """
+    for attempt in range(MAX_SLIDES_RETRIES):
+        with _SLIDES_SEMAPHORE:
+            try:
+                return request.execute()
+            except HttpError as e:
+                # The exception name is unbound once the block exits
+                status = e.resp.status
+                retryable = status == 429 or (status in RETRYABLE_STATUS_CODES and retry_unavailable)
+                if not retryable or attempt == MAX_SLIDES_RETRIES - 1:
+                    raise
+        delay = 2 ** attempt + random.random()
+        logger.info("Slides API returned %s, retrying in %.1fs", status, delay)
+        time.sleep(delay)
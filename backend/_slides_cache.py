@@ -0,0 +1,111 @@
+"""
+On-disk cache of Google Slides presentation payloads.
+
+Each row stores the last fetched presentation JSON for a given fields mask
+together with its revisionId, so a restarted worker can confirm the deck is
+unchanged with a cheap revision-only request instead of downloading it again.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+# SLIDES_CACHE_PATH may come from .env; this module can be imported first
+load_dotenv()
+
+CACHE_PATH = os.getenv(
+    "SLIDES_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "slides_cache.sqlite3")
+)
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database on first use and make sure the table exists."""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS presentations ("
+            "presentation_id TEXT, "
+            "fields TEXT, "
+            "payload BLOB, "
+            "PRIMARY KEY (presentation_id, fields))"
+        )
+        _conn.commit()
+    return _conn
+
+def load(presentation_id: str, fields: str) -> Optional[Dict]:
+    """
+    Return the stored presentation, if there is one.
+    
+    The caller compares its revisionId with the live one before trusting it.
+
+    Args:
+        presentation_id: The ID of the presentation
+        fields: The partial-response mask the payload was fetched with
+
+    Returns:
+        Optional[Dict]: The cached presentation, or None when nothing is stored
+    """
+    try:
+        with _lock:
+            row = _connect().execute(
+                "SELECT payload FROM presentations "
+                "WHERE presentation_id = ? AND fields = ?",
+                (presentation_id, fields)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Could not read presentation cache: %s", e)
+        return None
+    return json.loads(row[0]) if row else None
+
+def store(presentation_id: str, fields: str, presentation: Dict) -> None:
+    """
+    Save a fetched presentation, replacing any older row for the same mask.
+
+    Args:
+        presentation_id: The ID of the presentation
+        fields: The partial-response mask the payload was fetched with
+        presentation: The presentation resource, including its revisionId
+    """
+    # Without a revisionId a stored copy could never be validated
+    if not presentation.get('revisionId'):
+        return
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO presentations (presentation_id, fields, payload) "
+                "VALUES (?, ?, ?)",
+                (presentation_id, fields, json.dumps(presentation))
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("Could not write presentation cache: %s", e)
+
+def discard(presentation_id: str) -> None:
+    """
+    Delete every stored payload of a presentation, e.g. after it was edited.
+    
+    Args:
+        presentation_id: The ID of the presentation
+    """
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute(
+                "DELETE FROM presentations WHERE presentation_id = ?",
+                (presentation_id,)
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("Could not write presentation cache: %s", e)
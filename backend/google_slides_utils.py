@@ -20,19 +20,48 @@ Note:
     See Google Slides API documentation for authentication setup.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 import logging
+import time
+import httplib2
+import google_auth_httplib2
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import _slides_cache
+from _slides_api import execute_slides_request
+
+# Logging is configured by the application; this module only emits records
 logger = logging.getLogger(__name__)
 
 # Initialize Google Slides API client
 # Note: SLIDES should be initialized with proper credentials before use
 SLIDES = None  # This should be initialized with proper credentials
 
+@dataclass
+class _CachedPresentation:
+    """A fetched presentation together with lookup structures derived from it."""
+    fetched_at: float
+    presentation: Dict
+    element_index: Dict[str, Dict]  # objectId -> page element
+    image_ids_by_page: Dict[str, List[str]]  # page objectId -> image element IDs
+
+# Shape types treated as image placeholders by is_image_element
+_IMAGE_SHAPE_TYPES = frozenset({'RECTANGLE', 'PICTURE'})
+
+# Fields shared by every transform request this module sends
+_TRANSFORM_CORE = {'unit': 'EMU'}
+
+# Partial-response mask covering everything the helpers below read
+PRESENTATION_FIELDS = (
+    'revisionId,'
+    'slides(objectId,pageElements(objectId,size,transform,image,shape/shapeType))'
+)
+
+# Presentation metadata cache: (presentation_id, fields) -> cached entry
+_PRESENTATION_CACHE: Dict[Tuple[str, str], _CachedPresentation] = {}
+
 def initialize_slides_api(credentials_path: str) -> None:
     """
     Initialize the Google Slides API client with credentials.
@@ -46,101 +75,234 @@ def initialize_slides_api(credentials_path: str) -> None:
             credentials_path,
             scopes=['https://www.googleapis.com/auth/presentations']
         )
-        SLIDES = build('slides', 'v1', credentials=credentials)
+        # Share one authorized transport so every call reuses its pooled
+        # keep-alive connection instead of re-handshaking TLS
+        authed_http = google_auth_httplib2.AuthorizedHttp(
+            credentials,
+            http=httplib2.Http(timeout=60)
+        )
+        # Load the discovery document bundled with google-api-python-client
+        # rather than fetching it from Google on every process start
+        SLIDES = build(
+            'slides', 'v1',
+            http=authed_http,
+            static_discovery=True,
+            cache_discovery=False
+        )
         logger.info("Successfully initialized Google Slides API client")
     except Exception as e:
-        logger.error(f"Failed to initialize Google Slides API: {e}")
+        logger.error("Failed to initialize Google Slides API: %s", e)
         raise
 
-def get_element_by_id(presentation_id: str, element_id: str) -> Optional[Dict]:
+def _get_presentation(
+    presentation_id: str,
+    max_age: float = 30.0,
+    fields: str = PRESENTATION_FIELDS
+) -> _CachedPresentation:
+    """
+    Fetch a presentation, serving it from the metadata cache when fresh.
+    
+    When the in-memory copy has expired, or a copy is persisted on disk, only the
+    revisionId is requested first; if it matches, that copy is reused instead
+    of downloading the full presentation again. Without any copy the
+    presentation is fetched directly.
+    
+    Args:
+        presentation_id: The ID of the presentation
+        max_age: Maximum age in seconds of a cached copy before it is refetched
+        fields: Partial-response mask; copies fetched with another mask are not reused
+        
+    Returns:
+        _CachedPresentation: The presentation resource and its derived indexes
+    """
+    cached = _PRESENTATION_CACHE.get((presentation_id, fields))
+    if cached and time.monotonic() - cached.fetched_at < max_age:
+        return cached
+    
+    presentation = cached.presentation if cached else _slides_cache.load(presentation_id, fields)
+    if presentation:
+        revision_id = execute_slides_request(SLIDES.presentations().get(
+            presentationId=presentation_id,
+            fields='revisionId'
+        )).get('revisionId')
+        if not revision_id or revision_id != presentation.get('revisionId'):
+            presentation = None
+        elif cached:
+            # Unchanged since the last fetch, so the indexes are still valid
+            cached.fetched_at = time.monotonic()
+            return cached
+    if presentation is None:
+        presentation = execute_slides_request(SLIDES.presentations().get(
+            presentationId=presentation_id,
+            fields=fields
+        ))
+        _slides_cache.store(presentation_id, fields, presentation)
+    
+    slides = presentation.get('slides', [])
+    cached = _CachedPresentation(
+        fetched_at=time.monotonic(),
+        presentation=presentation,
+        element_index={
+            element['objectId']: element
+            for slide in slides
+            for element in slide.get('pageElements', [])
+        },
+        image_ids_by_page={
+            slide['objectId']: [
+                element['objectId'] for element in slide.get('pageElements', [])
+                if is_image_element(element)
+            ]
+            for slide in slides
+        }
+    )
+    _PRESENTATION_CACHE[(presentation_id, fields)] = cached
+    return cached
+
+def invalidate_presentation_cache(presentation_id: str) -> None:
+    """
+    Drop any cached metadata for a presentation so the next read refetches it.
+    
+    The copies persisted on disk are dropped too: after an edit the revision
+    has changed, so probing it would only confirm they are stale.
+    
+    Args:
+        presentation_id: The ID of the presentation
+    """
+    for key in [key for key in _PRESENTATION_CACHE if key[0] == presentation_id]:
+        del _PRESENTATION_CACHE[key]
+    _slides_cache.discard(presentation_id)
+
+def get_element_by_id(
+    presentation_id: str,
+    element_id: str,
+    fields: str = PRESENTATION_FIELDS
+) -> Optional[Dict]:
     """
     Retrieve an element from a presentation by its ID.
     
+    The element is partial: it only carries the fields requested by the
+    fields mask, which by default covers objectId, size, transform, image and
+    shape/shapeType. Pass a wider mask (e.g. '*') for title, description or
+    shape text.
+    
     Args:
         presentation_id: The ID of the presentation
         element_id: The ID of the element to retrieve
+        fields: Partial-response mask the presentation is fetched with
         
     Returns:
-        Optional[Dict]: The element if found, None otherwise
+        Optional[Dict]: The partial element if found, None otherwise
     """
     try:
-        presentation = SLIDES.presentations().get(
-            presentationId=presentation_id
-        ).execute()
-        
-        for slide in presentation.get('slides', []):
-            for element in slide.get('pageElements', []):
-                if element['objectId'] == element_id:
-                    return element
-        return None
+        return _get_presentation(presentation_id, fields=fields).element_index.get(element_id)
     except Exception as e:
-        logger.error(f"Error retrieving element: {e}")
+        logger.error("Error retrieving element: %s", e)
         return None
 
-def resize_element(presentation_id: str, element_id: str, scale_factor: float) -> Optional[Dict]:
+def _transform_request(object_id: str, transform: Dict, apply_mode: str) -> Dict:
     """
-    Resize an element by a scale factor while maintaining its aspect ratio and center position.
+    Build an updatePageElementTransform request.
+    
+    Args:
+        object_id: The ID of the element to transform
+        transform: The numeric transform fields (scale/translate)
+        apply_mode: 'ABSOLUTE' or 'RELATIVE'
+        
+    Returns:
+        Dict: A single batchUpdate request
+    """
+    return {
+        'updatePageElementTransform': {
+            'objectId': object_id,
+            'transform': transform | _TRANSFORM_CORE,
+            'applyMode': apply_mode
+        }
+    }
+
+def resize_elements_bulk(presentation_id: str, ops: List[Tuple[str, float]]) -> Optional[Dict]:
+    """
+    Resize several elements in a single batchUpdate, keeping each one centered.
     
     Args:
         presentation_id: The ID of the presentation
-        element_id: The ID of the element to resize
-        scale_factor: Factor to scale by (>1 for increase, <1 for decrease)
+        ops: List of (element_id, scale_factor) pairs
         
     Returns:
-        Optional[Dict]: The API response if successful, None otherwise
+        Optional[Dict]: The API response if successful, None if no element was found
         
     Raises:
-        ValueError: If scale_factor is not positive
+        ValueError: If any scale_factor is not positive
         Exception: If the API request fails
     """
-    if scale_factor <= 0:
+    if any(scale_factor <= 0 for _, scale_factor in ops):
         raise ValueError("Scale factor must be positive")
         
     try:
-        # Get the current element
-        element = get_element_by_id(presentation_id, element_id)
-        if not element:
-            logger.error(f"Could not find element with ID {element_id}")
-            return None
+        requests = []
+        for element_id, scale_factor in ops:
+            # Get the current element
+            element = get_element_by_id(presentation_id, element_id)
+            if not element:
+                logger.error("Could not find element with ID %s", element_id)
+                continue
 
-        # Get current size and position
-        current_height = element['size']['height']['magnitude']
-        current_width = element['size']['width']['magnitude']
-        current_x = element['transform']['translateX']
-        current_y = element['transform']['translateY']
-        
-        # Calculate position adjustment to keep element centered
-        x_adjust = (current_width - (current_width * scale_factor)) / 2
-        y_adjust = (current_height - (current_height * scale_factor)) / 2
-        
-        # Create the update request
-        requests = [{
-            'updatePageElementTransform': {
-                'objectId': element_id,
-                'transform': {
+            # Get current size and position
+            current_height = element['size']['height']['magnitude']
+            current_width = element['size']['width']['magnitude']
+            current_x = element['transform']['translateX']
+            current_y = element['transform']['translateY']
+            
+            # Calculate position adjustment to keep element centered
+            half_factor = 0.5 * (1.0 - scale_factor)
+            x_adjust = current_width * half_factor
+            y_adjust = current_height * half_factor
+            
+            requests.append(_transform_request(
+                element_id,
+                {
                     'scaleX': scale_factor,
                     'scaleY': scale_factor,
                     'translateX': current_x + x_adjust,
-                    'translateY': current_y + y_adjust,
-                    'unit': 'EMU'
+                    'translateY': current_y + y_adjust
                 },
-                'applyMode': 'ABSOLUTE'
-            }
-        }]
+                'ABSOLUTE'
+            ))
         
-        # Execute the update
-        response = SLIDES.presentations().batchUpdate(
+        if not requests:
+            return None
+        
+        # Execute all updates in one round-trip
+        response = execute_slides_request(SLIDES.presentations().batchUpdate(
             presentationId=presentation_id,
             body={'requests': requests}
-        ).execute()
+        ))
+        invalidate_presentation_cache(presentation_id)
         
-        logger.info(f"Successfully resized element by factor {scale_factor}")
+        logger.info("Successfully resized %s element(s)", len(requests))
         return response
         
     except Exception as e:
-        logger.error(f"Error resizing element: {e}")
+        logger.error("Error resizing elements: %s", e)
         raise
 
+def resize_element(presentation_id: str, element_id: str, scale_factor: float) -> Optional[Dict]:
+    """
+    Resize an element by a scale factor while maintaining its aspect ratio and center position.
+    
+    Args:
+        presentation_id: The ID of the presentation
+        element_id: The ID of the element to resize
+        scale_factor: Factor to scale by (>1 for increase, <1 for decrease)
+        
+    Returns:
+        Optional[Dict]: The API response if successful, None otherwise
+        
+    Raises:
+        ValueError: If scale_factor is not positive
+        Exception: If the API request fails
+    """
+    return resize_elements_bulk(presentation_id, [(element_id, scale_factor)])
+
 def is_image_element(element: Dict) -> bool:
     """
     Check if an element is an image.
@@ -151,45 +313,45 @@ def is_image_element(element: Dict) -> bool:
     Returns:
         bool: True if the element is an image, False otherwise
     """
-    return 'image' in element or (
-        'shape' in element and 
-        element['shape'].get('shapeType') in ['RECTANGLE', 'PICTURE']
-    )
+    if 'image' in element:
+        return True
+    shape = element.get('shape')
+    return shape is not None and shape.get('shapeType') in _IMAGE_SHAPE_TYPES
 
-def get_image_elements(presentation_id: str, page_id: str) -> List[Dict]:
+def get_image_elements(
+    presentation_id: str,
+    page_id: str,
+    fields: str = PRESENTATION_FIELDS
+) -> List[Dict]:
     """
     Get all image elements on a specific page of a presentation.
     
+    The elements are partial: they only carry the fields requested by the
+    fields mask, which by default covers objectId, size, transform, image and
+    shape/shapeType. A wider mask (e.g. '*') must still include those fields
+    for images to be recognised.
+    
     Args:
         presentation_id: The ID of the presentation
         page_id: The ID of the page to search
+        fields: Partial-response mask the presentation is fetched with
         
     Returns:
-        List[Dict]: List of image elements found on the page
+        List[Dict]: List of partial image elements found on the page
     """
     try:
-        presentation = SLIDES.presentations().get(
-            presentationId=presentation_id
-        ).execute()
-        
-        # Find the specified page
-        page = next(
-            (p for p in presentation.get('slides', []) if p['objectId'] == page_id),
-            None
-        )
-                
-        if not page:
-            logger.error(f"Could not find page with ID {page_id}")
+        cached = _get_presentation(presentation_id, fields=fields)
+        
+        # Image IDs are classified once per cache fill
+        image_ids = cached.image_ids_by_page.get(page_id)
+        if image_ids is None:
+            logger.error("Could not find page with ID %s", page_id)
             return []
             
-        # Get all image elements on the page
-        return [
-            element for element in page.get('pageElements', [])
-            if is_image_element(element)
-        ]
+        return [cached.element_index[image_id] for image_id in image_ids]
         
     except Exception as e:
-        logger.error(f"Error getting image elements: {e}")
+        logger.error("Error getting image elements: %s", e)
         return []
 
 def resize_image(presentation_id: str, image_id: str, scale_factor: float) -> Optional[Dict]:
@@ -215,31 +377,27 @@ def resize_image(presentation_id: str, image_id: str, scale_factor: float) -> Op
         # Get the current image
         image = get_element_by_id(presentation_id, image_id)
         if not image or not is_image_element(image):
-            logger.error(f"Could not find image with ID {image_id}")
+            logger.error("Could not find image with ID %s", image_id)
             return None
             
         # Create the update request
-        requests = [{
-            'updatePageElementTransform': {
-                'objectId': image_id,
-                'transform': {
-                    'scaleX': scale_factor,
-                    'scaleY': scale_factor,
-                    'unit': 'EMU'
-                },
-                'applyMode': 'RELATIVE'
-            }
-        }]
+        requests = [_transform_request(
+            image_id,
+            {'scaleX': scale_factor, 'scaleY': scale_factor},
+            'RELATIVE'
+        )]
         
-        # Execute the update
-        response = SLIDES.presentations().batchUpdate(
+        # Execute the update; a RELATIVE transform applied before a 503 would
+        # scale the image twice if retried
+        response = execute_slides_request(SLIDES.presentations().batchUpdate(
             presentationId=presentation_id,
             body={'requests': requests}
-        ).execute()
+        ), retry_unavailable=False)
+        invalidate_presentation_cache(presentation_id)
         
-        logger.info(f"Successfully resized image by factor {scale_factor}")
+        logger.info("Successfully resized image by factor %s", scale_factor)
         return response
         
     except Exception as e:
-        logger.error(f"Error resizing image: {e}")
+        logger.error("Error resizing image: %s", e)
         raise 
\ No newline at end of file
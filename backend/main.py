@@ -1,22 +1,42 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+import anyio
+import asyncio
+import pathlib
 import sys
 import os
 
-# Add parent directory to path to import nlp_editor
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Make the sibling nlp_editor importable however the app is launched
+BACKEND_DIR = str(pathlib.Path(__file__).resolve().parent)
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
 from nlp_editor import process_text_request, authenticate_google_slides
+from _slides_api import MAX_CONCURRENT_SLIDES_CALLS
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
-# Configure CORS
+# Each request makes its Slides calls one after another, so admitting as many
+# requests as the Slides window has slots keeps it full; the window in
+# _slides_api is the real limit, and extra requests wait here on the event
+# loop instead of holding worker threads
+MAX_CONCURRENT_REQUESTS = MAX_CONCURRENT_SLIDES_CALLS
+request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Configure CORS from a comma-separated allowlist, parsed once at startup
+DEFAULT_CORS_ORIGINS = "https://docs.google.com,http://localhost:3000"
+ALLOWED_ORIGINS = frozenset(
+    origin.strip()
+    for origin in (os.getenv("CORS_ORIGINS") or DEFAULT_CORS_ORIGINS).split(",")
+    if origin.strip()
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
+    allow_origins=sorted(ALLOWED_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # Initialize Google Slides authentication on startup
@@ -33,26 +53,28 @@ async def startup_event():
 class TextRequest(BaseModel):
     text: str
 
+def _ensure_authenticated():
+    """Make sure Google credentials are loaded and fresh (cheap when already valid)."""
+    authenticate_google_slides()
+
 @app.post("/process")
 async def process_text(request: TextRequest):
     """Process the text using nlp_editor"""
-    try:
-        result = process_text_request(request.text)
-        return {"result": result}
-    except FileNotFoundError:
-        # Try to authenticate again if token is missing
+    async with request_semaphore:
+        # Run the blocking Google API calls off the event loop thread
         try:
-            authenticate_google_slides()
-            # Retry the request after authentication
-            result = process_text_request(request.text)
-            return {"result": result}
+            await anyio.to_thread.run_sync(_ensure_authenticated)
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to authenticate with Google Slides: {str(e)}"
             )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error processing text: {str(e)}"
-        ) 
\ No newline at end of file
+        
+        try:
+            result = await anyio.to_thread.run_sync(process_text_request, request.text)
+            return {"result": result}
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error processing text: {str(e)}"
+            )
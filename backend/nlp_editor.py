@@ -1,24 +1,41 @@
 import os
 import logging
+import logging.handlers
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from dotenv import load_dotenv
-from typing import Dict, Any, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import atexit
 import datetime
+import queue
+import re
+import string
+import threading
 
-# Configure logging
+from _slides_api import execute_slides_request
+
+# Configure logging; records are handed to a background listener thread so
+# file and console writes never block the request path
 log_filename = "voxdeck.log"
+_log_handlers = [
+    logging.FileHandler(log_filename, mode='w', delay=True),  # 'w' mode overwrites the file
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('🔍 %(message)s'))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='🔍 %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename, mode='w'),  # 'w' mode overwrites the file
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -29,15 +46,40 @@ logging.getLogger('oauth2client').setLevel(logging.ERROR)
 load_dotenv()
 PRESENTATION_ID = os.getenv("PRESENTATION_ID")
 
+# Verbosity of this module's logs, e.g. WARNING in production; an unknown
+# level name falls back to INFO instead of failing the import
+LOG_LEVEL = (os.getenv("LOG_LEVEL") or "INFO").upper()
+try:
+    logger.setLevel(LOG_LEVEL)
+except ValueError:
+    logger.setLevel(logging.INFO)
+    logger.warning("Unknown LOG_LEVEL '%s', using INFO", LOG_LEVEL)
+
 # Get absolute paths for credential files
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TOKEN_FILE = os.path.join(BASE_DIR, "token.json")
 CREDENTIALS_FILE = os.path.join(BASE_DIR, "credentials.json")
 SCOPES = ["https://www.googleapis.com/auth/presentations"]
 
+# Cached OAuth credentials, only refreshed once the token expires, and the
+# token.json mtime they were loaded from or saved at
+_CREDS = None
+_CREDS_MTIME = None
+_CREDS_LOCK = threading.Lock()
+
+# Slides service cache; httplib2 transports are not thread-safe, so each
+# worker thread builds and keeps its own service
+_SERVICE_CACHE = threading.local()
+
 # Google Slides uses a different coordinate system
 SLIDE_WIDTH = 9144000  # Standard 16:9 presentation width in EMU
 SLIDE_HEIGHT = 5143500  # Standard 16:9 presentation height in EMU
+_INV_SLIDE_WIDTH = 1.0 / SLIDE_WIDTH
+_INV_SLIDE_HEIGHT = 1.0 / SLIDE_HEIGHT
+
+# Relative boundaries dividing the slide into thirds
+GRID_LOW = 0.33
+GRID_HIGH = 0.66
 
 # Color definitions
 COLORS = {
@@ -48,6 +90,110 @@ COLORS = {
     "white": {"red": 1, "green": 1, "blue": 1}
 }
 
+def _rgb_key(color: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    """Hashable form of an rgbColor dict."""
+    return color.get("red", 0), color.get("green", 0), color.get("blue", 0)
+
+# Reverse lookup of color names by RGB value
+COLOR_NAME_BY_RGB = {_rgb_key(rgb): name for name, rgb in COLORS.items()}
+
+# Partial-response mask covering every field read from a presentation fetch;
+# images only need a field present to be recognised, and text runs only
+# contribute their content and font size
+PRESENTATION_FIELDS = (
+    "revisionId,"
+    "slides(pageElements(objectId,"
+    "transform(scaleX,scaleY,translateX,translateY),"
+    "size(width/magnitude,height/magnitude),"
+    "image/contentUrl,"
+    "shape(text(textElements(textRun(content,style/fontSize))))))"
+)
+
+# Shared read-only default for optional nested fields of API responses
+_EMPTY: Dict[str, Any] = {}
+
+# Text that identifies the deck's main title element
+TITLE_MARKER = "welcome to voxdeck"
+
+def _compile_phrases(phrases: List[str], whole_words: bool = False) -> "re.Pattern[str]":
+    """
+    Compile phrases into a single alternation that scans a request once.
+    Longer phrases come first so a phrase is never cut short by one of its prefixes.
+    With whole_words, phrases only match on word boundaries.
+    """
+    pattern = '|'.join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    return re.compile(rf'\b(?:{pattern})\b' if whole_words else pattern)
+
+# Characters trimmed from both ends of text extracted from a request
+_STRIP_CHARS = string.whitespace + "'\""
+
+def _clean(text: str) -> str:
+    """Trim whitespace and surrounding quotes from text extracted from a request."""
+    return text.strip(_STRIP_CHARS)
+
+# Color change patterns - checked before text changes
+COLOR_PATTERNS = [
+    "make it", "change color to", "set color to",
+    "change to", "make text", "set text color to",
+    "change text color to", "make the text", "change the color",
+    "set the color", "color the text"
+]
+
+# Font change patterns
+FONT_PATTERNS = [
+    "change font to", "set font to", "make font",
+    "change to font", "use font", "switch to font",
+    "make all fonts", "change all fonts to", "set all fonts to",
+    "make fonts", "change fonts to", "set fonts to"
+]
+
+# Change text actions - enhanced for natural speech
+CHANGE_PATTERNS = [
+    "change to", "change it to", "make it say",
+    "set it to", "replace with", "update to",
+    "set to", "change the text to say", "change the text to",
+    "change to say", "say"
+]
+
+# Resize actions - enhanced for natural speech
+RESIZE_INCREASE = [
+    'bigger', 'larger', 'increase size', 'make it bigger', 
+    'expand', 'grow', 'enlarge', 'increase', 'make bigger',
+    'increase the size', 'make it larger', 'make the image bigger',
+    'increase image size', 'enlarge the image', 'make image bigger'
+]
+RESIZE_DECREASE = [
+    'smaller', 'decrease size', 'make it smaller', 'shrink', 
+    'reduce', 'make smaller', 'decrease', 'reduce size',
+    'decrease the size', 'make it reduce', 'make the image smaller',
+    'decrease image size', 'shrink the image', 'make image smaller'
+]
+
+# Enhanced position keywords for natural speech
+POSITION_KEYWORDS = {
+    'top': ['top', 'topmost', 'upper', 'uppermost', 'above', 'up', 'top of', 'upper part', 'at the top'],
+    'bottom': ['bottom', 'bottommost', 'lower', 'lowermost', 'below', 'down', 'bottom of', 'lower part', 'at the bottom'],
+    'left': ['left', 'leftmost', 'beginning', 'start', 'left side', 'on the left'],
+    'right': ['right', 'rightmost', 'end', 'right side', 'on the right'],
+    'center': ['center', 'middle', 'centered', 'centre', 'in the middle']
+}
+
+COLOR_PATTERN_RE = _compile_phrases(COLOR_PATTERNS)
+FONT_PATTERN_RE = _compile_phrases(FONT_PATTERNS)
+CHANGE_PATTERN_RE = _compile_phrases(CHANGE_PATTERNS)
+RESIZE_INCREASE_RE = _compile_phrases(RESIZE_INCREASE)
+RESIZE_DECREASE_RE = _compile_phrases(RESIZE_DECREASE)
+# One whole-word scan over all position keywords; each hit is reported
+# through the named group of its position
+POSITION_KEYWORD_RE = re.compile(r'\b(?:{})\b'.format('|'.join(
+    f"(?P<{pos}>{_compile_phrases(keywords).pattern})"
+    for pos, keywords in POSITION_KEYWORDS.items()
+)))
+
+# Request words asking to move an element, and words naming where the target is
+MOVE_KEYWORD_RE = _compile_phrases(['move', 'place', 'put', 'position', 'relocate'])
+TARGET_HINT_RE = _compile_phrases(['title', 'top', 'bottom', 'left', 'right', 'center', 'up', 'down'])
+
 class ElementType(Enum):
     TEXT = "text"
     SHAPE = "shape"
@@ -64,14 +210,54 @@ class Position(Enum):
     BOTTOM = "bottom"
     BOTTOM_RIGHT = "bottom_right"
 
-@dataclass
+# Position members by value, avoiding the Enum lookup machinery per query
+POSITION_BY_VALUE = {pos.value: pos for pos in Position}
+
+# Grid cells by (row, column), matching the layout in get_position_from_coordinates
+_GRID_POSITIONS = (
+    (Position.TOP_LEFT, Position.TOP, Position.TOP_RIGHT),
+    (Position.LEFT, Position.CENTER, Position.RIGHT),
+    (Position.BOTTOM_LEFT, Position.BOTTOM, Position.BOTTOM_RIGHT)
+)
+
+# Destinations for move requests, checked in priority order
+MOVE_TARGETS = (
+    ('bottom', Position.BOTTOM),
+    ('top', Position.TOP),
+    ('left', Position.LEFT),
+    ('right', Position.RIGHT),
+    ('center', Position.CENTER)
+)
+
+@dataclass(slots=True)
 class SlideElement:
     object_id: str
     element_type: ElementType
     content: str
-    position: Dict[str, float]  # x, y coordinates
-    size: Dict[str, float]      # width, height
+    x: float                    # translateX in EMU
+    y: float                    # translateY in EMU
+    width: float                # in EMU
+    height: float               # in EMU
     page_number: int
+    grid_position: Position     # 3x3 grid cell, computed once at ingest
+    content_lower: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.content_lower = self.content.lower()
+
+@dataclass
+class PresentationSnapshot:
+    """Elements of one presentation fetch, plus lookups derived from them."""
+    elements: Dict[str, SlideElement]
+    page_elements: Dict[str, Dict[str, Any]]  # raw page elements by objectId
+    by_type: Dict[ElementType, List[SlideElement]]
+    by_position: Dict[Position, List[SlideElement]]
+    title_element: Optional[SlideElement]
+    revision_id: Optional[str] = None
+
+# Last snapshot built by get_presentation_elements; reused while the
+# presentation's revisionId is unchanged
+_SNAPSHOT: Optional[PresentationSnapshot] = None
 
 class ActionType(Enum):
     CHANGE_TEXT = "change_text"
@@ -79,16 +265,38 @@ class ActionType(Enum):
     CHANGE_FONT = "change_font"
     CHANGE_COLOR = "change_color"
 
+def _token_mtime() -> Optional[float]:
+    """Modification time of token.json, or None if it does not exist."""
+    try:
+        return os.stat(TOKEN_FILE).st_mtime
+    except FileNotFoundError:
+        return None
+
+def _current_creds():
+    """
+    Return the cached credentials, reparsing token.json only when it changed
+    on disk since it was last loaded or saved. Call with _CREDS_LOCK held.
+    """
+    global _CREDS, _CREDS_MTIME
+    mtime = _token_mtime()
+    if mtime is not None and mtime != _CREDS_MTIME:
+        _CREDS = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+        _CREDS_MTIME = mtime
+    return _CREDS
+
 def authenticate_google_slides():
-    """Authenticate with Google Slides API."""
-    creds = None
-    
-    # Check if token file exists
-    if os.path.exists(TOKEN_FILE):
-        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-    
-    # If no valid credentials available, let the user log in
-    if not creds or not creds.valid:
+    """
+    Authenticate with Google Slides API.
+    Credentials are cached in memory and only refreshed when they expire,
+    so calling this on every request is cheap.
+    """
+    global _CREDS, _CREDS_MTIME
+    with _CREDS_LOCK:
+        creds = _current_creds()
+        if creds and creds.valid:
+            return creds
+        
+        # If no valid credentials available, let the user log in
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
         else:
@@ -103,16 +311,33 @@ def authenticate_google_slides():
         # Save the credentials for the next run
         with open(TOKEN_FILE, 'w') as token:
             token.write(creds.to_json())
-    
-    return creds
+        
+        _CREDS, _CREDS_MTIME = creds, _token_mtime()
+        return creds
 
 def get_slides_service():
-    """Initialize and return the Google Slides service."""
-    if not os.path.exists(TOKEN_FILE):
+    """
+    Return the Google Slides service, building it once per thread.
+    Credentials come from the in-memory cache, and token.json is only
+    reparsed when it changes on disk. Expired credentials are refreshed
+    before the service is handed out rather than on a failed call.
+    """
+    with _CREDS_LOCK:
+        creds = _current_creds()
+    if creds is None:
         raise FileNotFoundError("Token file not found. Please run authentication first.")
-    
-    creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-    return build("slides", "v1", credentials=creds)
+    if creds.expired and creds.refresh_token:
+        creds = authenticate_google_slides()
+    
+    # Rebuild only if the credentials were replaced since this thread's build
+    service = getattr(_SERVICE_CACHE, 'service', None)
+    if service is not None and _SERVICE_CACHE.creds is creds:
+        return service
+    
+    # Use the discovery document bundled with the client library
+    service = build("slides", "v1", credentials=creds, static_discovery=True, cache_discovery=False)
+    _SERVICE_CACHE.service, _SERVICE_CACHE.creds = service, creds
+    return service
 
 def get_position_from_coordinates(x: float, y: float, width: float, height: float) -> Position:
     """
@@ -123,198 +348,244 @@ def get_position_from_coordinates(x: float, y: float, width: float, height: floa
     LEFT         CENTER  RIGHT
     BOTTOM_LEFT  BOTTOM  BOTTOM_RIGHT
     """
-    # Convert coordinates to relative positions (0-1)
-    # Add half the width/height to get the center point
-    x_center = (x + width/2) / SLIDE_WIDTH
-    y_center = (y + height/2) / SLIDE_HEIGHT
-    
-    logger.info(f"Position analysis for ({x}, {y}):")
-    logger.info(f"  - Relative center point: ({x_center:.2f}, {y_center:.2f})")
-    
-    # Define the grid sections
-    HORIZONTAL = [0.33, 0.66]  # Divide into thirds horizontally
-    
-    # Determine horizontal position
-    if x_center <= HORIZONTAL[0]:
-        h_pos = "left"
-    elif x_center >= HORIZONTAL[1]:
-        h_pos = "right"
-    else:
-        h_pos = "center"
-        
-    # Determine vertical position with more precise boundaries for top
-    if y_center <= 0.33:  # Top third
-        v_pos = "top"
-    elif y_center >= 0.66:  # Bottom third
-        v_pos = "bottom"
-    else:
-        v_pos = "center"
-    
-    logger.info(f"  - Grid position: {v_pos}_{h_pos}")
-    
-    # Combine positions with priority to vertical position
-    if v_pos == "center" and h_pos == "center":
-        position_str = "center"
-    elif v_pos == "center":
-        position_str = h_pos
-    elif h_pos == "center":
-        position_str = v_pos
+    # Convert the element's center point to relative positions (0-1) and
+    # pick its row and column of the grid
+    x_center = (x + width * 0.5) * _INV_SLIDE_WIDTH
+    y_center = (y + height * 0.5) * _INV_SLIDE_HEIGHT
+    column = 0 if x_center <= GRID_LOW else 2 if x_center >= GRID_HIGH else 1
+    row = 0 if y_center <= GRID_LOW else 2 if y_center >= GRID_HIGH else 1
+    
+    logger.debug("Position analysis for (%s, %s): center (%.2f, %.2f), cell %s,%s",
+                 x, y, x_center, y_center, row, column)
+    return _GRID_POSITIONS[row][column]
+
+def _index_page_elements(presentation: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map every raw page element in the presentation by its objectId."""
+    return {
+        page_element.get('objectId'): page_element
+        for slide in presentation.get('slides', [])
+        for page_element in slide.get('pageElements', [])
+    }
+
+def _group_by_position(elements: Dict[str, SlideElement]) -> Dict[Position, List[SlideElement]]:
+    """Bucket elements by grid position, keeping their slide order."""
+    by_position = {pos: [] for pos in Position}
+    for element in elements.values():
+        by_position[element.grid_position].append(element)
+    return by_position
+
+def _to_slide_element(element: Dict[str, Any], page_number: int) -> Optional[SlideElement]:
+    """Build a SlideElement from a raw page element, or None if it has no text or image."""
+    # Classify first so decorative shapes are dropped before any other reads
+    shape = element.get('shape')
+    if shape:
+        text_elements = shape.get('text', _EMPTY).get('textElements')
+        if not text_elements:
+            return None
+        content = ''.join(
+            text_element['textRun'].get('content', '')
+            for text_element in text_elements
+            if 'textRun' in text_element
+        ).strip()
+        if not content:  # Only process elements with actual text
+            return None
+        element_type = ElementType.TEXT
+    elif 'image' in element:
+        element_type = ElementType.IMAGE
+        content = "[Image]"  # Use a placeholder for image content
     else:
-        position_str = f"{v_pos}_{h_pos}"
+        return None
     
-    try:
-        return Position(position_str)
-    except ValueError:
-        logger.info(f"  - Could not map '{position_str}' to enum, defaulting to CENTER")
-        return Position.CENTER
+    # Get position and size; the API omits zero-valued fields
+    transform = element.get('transform', _EMPTY)
+    x = transform.get('translateX', 0)
+    y = transform.get('translateY', 0)
+    size = element.get('size', _EMPTY)
+    width = size.get('width', _EMPTY).get('magnitude', 0)
+    height = size.get('height', _EMPTY).get('magnitude', 0)
+    logger.debug("Found %s element: '%.50s' at (%s, %s), size %s x %s",
+                 element_type.value, content, x, y, width, height)
+    
+    return SlideElement(
+        object_id=element.get('objectId'),
+        element_type=element_type,
+        content=content,
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        page_number=page_number,
+        grid_position=get_position_from_coordinates(x, y, width, height)
+    )
 
-def get_presentation_elements() -> Dict[str, SlideElement]:
-    """Get all elements from the presentation with their positions and properties."""
+def get_presentation_elements() -> PresentationSnapshot:
+    """
+    Get all elements from the presentation with their positions and properties.
+    The snapshot also carries the raw page elements indexed by objectId, so
+    callers can hand them to the edit helpers instead of fetching the
+    presentation again, and elements indexed by type plus the title element.
+    The snapshot is cached and only rebuilt once the presentation's
+    revisionId changes, so an unchanged deck costs a revision-only request.
+    """
+    global _SNAPSHOT
     service = get_slides_service()
-    presentation = service.presentations().get(
-        presentationId=PRESENTATION_ID
-    ).execute()
+    cached = _SNAPSHOT
+    if cached is not None and cached.revision_id:
+        revision_id = execute_slides_request(
+            service.presentations().get(
+                presentationId=PRESENTATION_ID,
+                fields="revisionId"
+            )
+        ).get('revisionId')
+        if revision_id == cached.revision_id:
+            logger.info("Presentation unchanged, reusing scanned elements")
+            return cached
+    
+    presentation = execute_slides_request(
+        service.presentations().get(
+            presentationId=PRESENTATION_ID,
+            fields=PRESENTATION_FIELDS
+        )
+    )
     
     logger.info("Scanning presentation elements...")
-    elements = {}
-    for page_number, slide in enumerate(presentation.get('slides', []), 1):
-        logger.info(f"Processing slide {page_number}")
-        for element in slide.get('pageElements', []):
-            element_id = element.get('objectId')
-            
-            # Get position and size
-            transform = element.get('transform', {})
-            position = {
-                'x': transform.get('translateX', 0),
-                'y': transform.get('translateY', 0)
-            }
-            size = {
-                'width': element.get('size', {}).get('width', {}).get('magnitude', 0),
-                'height': element.get('size', {}).get('height', {}).get('magnitude', 0)
-            }
-            
-            # Handle different element types
-            if 'shape' in element and 'text' in element['shape']:
-                text_content = ''
-                for text_element in element['shape']['text'].get('textElements', []):
-                    if 'textRun' in text_element:
-                        text_content += text_element['textRun'].get('content', '')
-                
-                text_content = text_content.strip()
-                if text_content:  # Only process elements with actual text
-                    logger.info(f"Found text element: '{text_content[:50]}' at ({position['x']}, {position['y']})")
-                    logger.info(f"Element size: {size['width']} x {size['height']}")
-                    
-                    slide_element = SlideElement(
-                        object_id=element_id,
-                        element_type=ElementType.TEXT,
-                        content=text_content,
-                        position=position,
-                        size=size,
-                        page_number=page_number
-                    )
-                    elements[element_id] = slide_element
-            
-            # Handle image elements
-            elif 'image' in element:
-                logger.info(f"Found image element at ({position['x']}, {position['y']})")
-                logger.info(f"Image size: {size['width']} x {size['height']}")
-                
-                slide_element = SlideElement(
-                    object_id=element_id,
-                    element_type=ElementType.IMAGE,
-                    content="[Image]",  # Use a placeholder for image content
-                    position=position,
-                    size=size,
-                    page_number=page_number
-                )
-                elements[element_id] = slide_element
-    
-    logger.info(f"Found {len(elements)} elements total")
-    return elements
-
-def find_element_by_position(elements: Dict[str, SlideElement], target_position: str) -> SlideElement:
-    """Find an element based on position description."""
-    logger.info(f"Looking for element matching position: {target_position}")
-    
-    # Enhanced position keywords for natural speech
-    position_keywords = {
-        'top': ['top', 'upper', 'above', 'up', 'top of', 'upper part', 'at the top'],
-        'bottom': ['bottom', 'lower', 'below', 'down', 'bottom of', 'lower part', 'at the bottom'],
-        'left': ['left', 'leftmost', 'beginning', 'start', 'left side', 'on the left'],
-        'right': ['right', 'rightmost', 'end', 'right side', 'on the right'],
-        'center': ['center', 'middle', 'centered', 'centre', 'in the middle']
+    elements = {
+        slide_element.object_id: slide_element
+        for page_number, slide in enumerate(presentation.get('slides', ()), 1)
+        for element in slide.get('pageElements', ())
+        if (slide_element := _to_slide_element(element, page_number)) is not None
     }
     
+    logger.info("Found %s elements total", len(elements))
+    
+    by_type = {element_type: [] for element_type in ElementType}
+    by_position = _group_by_position(elements)
+    title_element = None
+    for element in elements.values():
+        by_type[element.element_type].append(element)
+        if title_element is None and TITLE_MARKER in element.content_lower:
+            title_element = element
+    
+    _SNAPSHOT = PresentationSnapshot(
+        elements=elements,
+        page_elements=_index_page_elements(presentation),
+        by_type=by_type,
+        by_position=by_position,
+        title_element=title_element,
+        revision_id=presentation.get('revisionId')
+    )
+    return _SNAPSHOT
+
+def _content_length(element: SlideElement) -> int:
+    """Ranking key preferring elements with more content."""
+    return len(element.content)
+
+@lru_cache(maxsize=None)
+def _general_area(target_pos_str: str) -> Tuple[Position, ...]:
+    """Grid positions sharing at least one position part with target_pos_str."""
+    target_parts = set(target_pos_str.split('_'))
+    return tuple(pos for pos in Position if target_parts.intersection(pos.value.split('_')))
+
+def find_element_by_position(elements: Dict[str, SlideElement], target_position: str,
+                             snapshot: Optional[PresentationSnapshot] = None) -> SlideElement:
+    """
+    Find an element based on position description.
+    If snapshot (from get_presentation_elements) is given, its title element
+    and grid-position buckets are used instead of rescanning the elements.
+    """
+    logger.info("Looking for element matching position: %s", target_position)
+    target_lc = target_position.lower()
+    
     # Special handling for title
-    if "title" in target_position.lower():
+    if "title" in target_lc:
         logger.info("Looking for main title element")
         # Find the element with "welcome to voxdeck" content
-        for element in elements.values():
-            if "welcome to voxdeck" in element.content.lower():
-                logger.info(f"Found title element: {element.content}")
-                return element
-    
-    # Parse the position from the description
-    target_pos_parts = set()  # Using set to avoid duplicates
-    for pos, keywords in position_keywords.items():
-        if any(keyword in target_position.lower() for keyword in keywords):
-            target_pos_parts.add(pos)
-            logger.info(f"Matched position keyword: {pos}")
-    
-    # Convert set to sorted list for consistent ordering
-    target_pos_parts = sorted(target_pos_parts)
-    target_pos_str = '_'.join(target_pos_parts) or 'center'
-    
-    try:
-        target_pos = Position(target_pos_str)
-        logger.info(f"Looking for elements in position: {target_pos.value}")
-    except ValueError:
-        logger.info(f"Could not resolve position '{target_pos_str}', defaulting to CENTER")
-        target_pos = Position.CENTER
-    
-    # Find matching elements
-    matching_elements = []
-    for element in elements.values():
-        element_pos = get_position_from_coordinates(
-            element.position['x'],
-            element.position['y'],
-            element.size['width'],
-            element.size['height']
-        )
-        if element_pos == target_pos:
-            matching_elements.append(element)
-            logger.info(f"Found matching element: '{element.content[:50]}'")
-    
-    if not matching_elements:
-        # If no exact match, try to find elements in the general area
-        logger.info("No exact position matches, looking for elements in the general area")
-        for element in elements.values():
-            pos = get_position_from_coordinates(
-                element.position['x'],
-                element.position['y'],
-                element.size['width'],
-                element.size['height']
+        if snapshot is not None:
+            title_element = snapshot.title_element
+        else:
+            title_element = next(
+                (element for element in elements.values() if TITLE_MARKER in element.content_lower),
+                None
             )
-            # Check if the position contains any of our target position parts
-            pos_parts = pos.value.split('_')
-            if any(part in pos_parts for part in target_pos_str.split('_')):
-                matching_elements.append(element)
-                logger.info(f"Found partial match: '{element.content[:50]}' at position {pos.value}")
+        if title_element:
+            logger.info("Found title element: %s", title_element.content)
+            return title_element
     
-    if not matching_elements:
+    # Parse the position from the description
+    # Position values put the vertical part first; 'center' only ever fills
+    # in for a missing part, and a later keyword overrides an earlier one
+    v_part = h_part = None
+    for match in POSITION_KEYWORD_RE.finditer(target_lc):
+        pos = match.lastgroup
+        logger.info("Matched position keyword: %s", pos)
+        if pos in ('top', 'bottom'):
+            v_part = pos
+        elif pos in ('left', 'right'):
+            h_part = pos
+    target_pos_str = f"{v_part}_{h_part}" if v_part and h_part else v_part or h_part or 'center'
+    
+    target_pos = POSITION_BY_VALUE.get(target_pos_str, Position.CENTER)
+    logger.info("Looking for elements in position: %s", target_pos.value)
+    
+    by_position = snapshot.by_position if snapshot is not None else _group_by_position(elements)
+    
+    # Prefer an exact grid match, then an element in the general area (shares
+    # a position part); within either, the element with the most content wins
+    exact_matches = by_position[target_pos]
+    if exact_matches:
+        logger.info("Found %s exact position matches", len(exact_matches))
+        return max(exact_matches, key=_content_length)
+    
+    # The exact bucket is empty here, so it needs no special exclusion
+    best_partial = max(
+        (element for pos in _general_area(target_pos_str) for element in by_position[pos]),
+        key=_content_length,
+        default=None
+    )
+    if best_partial is None:
         logger.info("No elements found in the specified position")
         return None
     
-    # If multiple matches, prefer elements with more content
-    matching_elements.sort(key=lambda x: len(x.content), reverse=True)
-    return matching_elements[0]
+    logger.info("No exact position matches, using an element in the general area")
+    return best_partial
 
-def update_element_text(object_id: str, new_text: str):
-    """Update the text of a specific element."""
+def send_batch_update(requests: List[Dict[str, Any]]):
+    """
+    Send edit requests to the presentation in a single batchUpdate.
+    The *_requests builders below return lists that can be concatenated, so
+    several edits can be applied in one round trip.
+    The cached snapshot is dropped afterwards, since the edit changes the
+    revision and a revision check would only confirm it is stale.
+    """
+    global _SNAPSHOT
     service = get_slides_service()
-    
-    requests = [
+    response = execute_slides_request(
+        service.presentations().batchUpdate(
+            presentationId=PRESENTATION_ID,
+            body={"requests": requests}
+        )
+    )
+    _SNAPSHOT = None
+    return response
+
+def _fetch_page_elements() -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch the presentation and index its raw page elements by objectId.
+    The builders below that take page_elements only call this when none is
+    given; pass the snapshot from get_presentation_elements to let several
+    edits share one fetch.
+    """
+    service = get_slides_service()
+    return _index_page_elements(execute_slides_request(
+        service.presentations().get(
+            presentationId=PRESENTATION_ID,
+            fields=PRESENTATION_FIELDS
+        )
+    ))
+
+def text_replace_requests(object_id: str, new_text: str) -> List[Dict[str, Any]]:
+    """Build the requests that replace all text of an element."""
+    return [
         {
             "deleteText": {
                 "objectId": object_id,
@@ -329,33 +600,22 @@ def update_element_text(object_id: str, new_text: str):
             }
         }
     ]
-    
-    service.presentations().batchUpdate(
-        presentationId=PRESENTATION_ID,
-        body={"requests": requests}
-    ).execute()
-    
+
+def update_element_text(object_id: str, new_text: str):
+    """Update the text of a specific element."""
+    send_batch_update(text_replace_requests(object_id, new_text))
     return True
 
-def resize_element(object_id: str, scale_factor: float):
-    """Resize an element by adjusting size or font size depending on type."""
-    service = get_slides_service()
-    
-    # Get current element properties
-    presentation = service.presentations().get(
-        presentationId=PRESENTATION_ID
-    ).execute()
-    
-    # Find the element
-    element = None
-    for slide in presentation.get('slides', []):
-        for page_element in slide.get('pageElements', []):
-            if page_element.get('objectId') == object_id:
-                element = page_element
-                break
-        if element:
-            break
+def resize_requests(object_id: str, scale_factor: float,
+                    page_elements: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """
+    Build the requests that resize an element, by font size or by scale
+    depending on its type. An empty list means there is nothing to resize.
+    """
+    if page_elements is None:
+        page_elements = _fetch_page_elements()
     
+    element = page_elements.get(object_id)
     if not element:
         raise ValueError(f"Element {object_id} not found")
     
@@ -365,17 +625,17 @@ def resize_element(object_id: str, scale_factor: float):
         text_elements = element.get('shape', {}).get('text', {}).get('textElements', [])
         if not text_elements:
             logger.error("No text elements found in shape")
-            return False
+            return []
             
         current_style = text_elements[0].get('textRun', {}).get('style', {})
         current_font_size = current_style.get('fontSize', {}).get('magnitude', 12)
-        logger.info(f"Current font size: {current_font_size}pt")
+        logger.info("Current font size: %spt", current_font_size)
         
         # Calculate new font size
         new_font_size = current_font_size + 5
-        logger.info(f"Setting new font size to: {new_font_size}pt")
+        logger.info("Setting new font size to: %spt", new_font_size)
         
-        requests = [{
+        return [{
             "updateTextStyle": {
                 "objectId": object_id,
                 "textRange": {
@@ -408,11 +668,11 @@ def resize_element(object_id: str, scale_factor: float):
         current_x = current_transform.get('translateX', 0)
         current_y = current_transform.get('translateY', 0)
         
-        logger.info(f"Current scale: ({current_scale_x}, {current_scale_y})")
-        logger.info(f"New scale: ({new_scale_x}, {new_scale_y})")
-        logger.info(f"Position: ({current_x}, {current_y})")
+        logger.info("Current scale: (%s, %s)", current_scale_x, current_scale_y)
+        logger.info("New scale: (%s, %s)", new_scale_x, new_scale_y)
+        logger.info("Position: (%s, %s)", current_x, current_y)
         
-        requests = [{
+        return [{
             "updatePageElementTransform": {
                 "objectId": object_id,
                 "transform": {
@@ -426,23 +686,27 @@ def resize_element(object_id: str, scale_factor: float):
             }
         }]
     
+    raise ValueError(f"Element {object_id} has no text or image to resize")
+
+def resize_element(object_id: str, scale_factor: float,
+                   page_elements: Optional[Dict[str, Dict[str, Any]]] = None):
+    """Resize an element by adjusting size or font size depending on type."""
+    requests = resize_requests(object_id, scale_factor, page_elements)
+    if not requests:
+        return False
+    
     try:
-        logger.info(f"Sending update request: {requests}")
-        response = service.presentations().batchUpdate(
-            presentationId=PRESENTATION_ID,
-            body={"requests": requests}
-        ).execute()
-        logger.info(f"API Response: {response}")
+        logger.debug("Sending update request: %s", requests)
+        response = send_batch_update(requests)
+        logger.debug("API Response: %s", response)
         return True
     except Exception as e:
-        logger.error(f"Error resizing element: {str(e)}")
+        logger.error("Error resizing element: %s", e)
         raise
 
-def update_font_family(object_id: str, font_family: str):
-    """Update the font family of a specific element."""
-    service = get_slides_service()
-    
-    requests = [{
+def font_family_requests(object_ids: List[str], font_family: str) -> List[Dict[str, Any]]:
+    """Build the requests that set the font family of each element."""
+    return [{
         "updateTextStyle": {
             "objectId": object_id,
             "textRange": {
@@ -453,20 +717,20 @@ def update_font_family(object_id: str, font_family: str):
             },
             "fields": "fontFamily"
         }
-    }]
-    
-    service.presentations().batchUpdate(
-        presentationId=PRESENTATION_ID,
-        body={"requests": requests}
-    ).execute()
-    
+    } for object_id in object_ids]
+
+def update_font_family(object_id: str, font_family: str):
+    """Update the font family of a specific element."""
+    return update_font_family_bulk([object_id], font_family)
+
+def update_font_family_bulk(object_ids: List[str], font_family: str):
+    """Update the font family of several elements in a single batchUpdate."""
+    send_batch_update(font_family_requests(object_ids, font_family))
     return True
 
-def update_text_color(object_id: str, color: Dict[str, Any]):
-    """Update the text color of a specific element."""
-    service = get_slides_service()
-    
-    requests = [{
+def text_color_requests(object_id: str, color: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build the requests that set the text color of an element."""
+    return [{
         "updateTextStyle": {
             "objectId": object_id,
             "textRange": {
@@ -482,127 +746,63 @@ def update_text_color(object_id: str, color: Dict[str, Any]):
             "fields": "foregroundColor"
         }
     }]
-    
-    service.presentations().batchUpdate(
-        presentationId=PRESENTATION_ID,
-        body={"requests": requests}
-    ).execute()
-    
+
+def update_text_color(object_id: str, color: Dict[str, Any]):
+    """Update the text color of a specific element."""
+    send_batch_update(text_color_requests(object_id, color))
     return True
 
 def parse_action(request: str) -> Tuple[ActionType, Dict[str, Any]]:
     """Parse the natural language request into an action type and parameters."""
-    logger.info(f"Parsing request: '{request}'")
+    logger.info("Parsing request: '%s'", request)
     request = request.lower().strip()
     
-    # Color change patterns - check these before text changes
-    color_patterns = [
-        "make it", "change color to", "set color to",
-        "change to", "make text", "set text color to",
-        "change text color to", "make the text", "change the color",
-        "set the color", "color the text"
-    ]
-    
     # First check for color changes since they're more specific
-    for color_name, rgb_values in COLORS.items():
-        if color_name in request:
-            # Check if any color pattern is present
-            for pattern in color_patterns:
-                if pattern in request:
-                    logger.info(f"Detected CHANGE_COLOR action with color: '{color_name}'")
-                    return ActionType.CHANGE_COLOR, {'color': rgb_values}
-    
-    # Font change patterns
-    font_patterns = [
-        "change font to", "set font to", "make font",
-        "change to font", "use font", "switch to font",
-        "make all fonts", "change all fonts to", "set all fonts to",
-        "make fonts", "change fonts to", "set fonts to"
-    ]
+    if COLOR_PATTERN_RE.search(request):
+        for color_name, rgb_values in COLORS.items():
+            if color_name in request:
+                logger.info("Detected CHANGE_COLOR action with color: '%s'", color_name)
+                return ActionType.CHANGE_COLOR, {'color': rgb_values}
     
     # Check for font changes
-    for pattern in font_patterns:
-        if pattern in request:
-            parts = request.split(pattern)
-            if len(parts) > 1:
-                font_name = parts[1].strip().strip("'").strip('"')
-                logger.info(f"Detected CHANGE_FONT action with font: '{font_name}'")
-                return ActionType.CHANGE_FONT, {'font_family': font_name}
-            # Special case for when font name comes right after "make all fonts" without "to"
-            elif pattern == "make all fonts" or pattern == "make fonts":
-                remaining_text = request.replace(pattern, "").strip()
-                if remaining_text:
-                    logger.info(f"Detected CHANGE_FONT action with font: '{remaining_text}'")
-                    return ActionType.CHANGE_FONT, {'font_family': remaining_text}
-    
-    # Change text actions - enhanced for natural speech
-    change_patterns = [
-        "change to", "change it to", "make it say",
-        "set it to", "replace with", "update to",
-        "set to", "change the text to say", "change the text to",
-        "change to say", "say"
-    ]
+    match = FONT_PATTERN_RE.search(request)
+    if match:
+        font_name = _clean(request[match.end():])
+        logger.info("Detected CHANGE_FONT action with font: '%s'", font_name)
+        return ActionType.CHANGE_FONT, {'font_family': font_name}
     
     # Check for text changes
-    for pattern in change_patterns:
-        if pattern in request:
-            # Split by the pattern and get the text after it
-            parts = request.split(pattern)
-            if len(parts) > 1:
-                new_text = parts[1].strip().strip("'").strip('"')
-                logger.info(f"Detected CHANGE_TEXT action with new text: '{new_text}'")
-                return ActionType.CHANGE_TEXT, {'new_text': new_text}
+    match = CHANGE_PATTERN_RE.search(request)
+    if match:
+        # Take the text after the pattern
+        new_text = _clean(request[match.end():])
+        logger.info("Detected CHANGE_TEXT action with new text: '%s'", new_text)
+        return ActionType.CHANGE_TEXT, {'new_text': new_text}
     
     # If no pattern matched but contains "change" and "to", try to extract text
     if "change" in request and "to" in request:
-        text_after_to = request.split("to")[-1].strip().strip("'").strip('"')
+        text_after_to = _clean(request.rpartition("to")[2])
         if text_after_to:
-            logger.info(f"Detected CHANGE_TEXT action with new text: '{text_after_to}'")
+            logger.info("Detected CHANGE_TEXT action with new text: '%s'", text_after_to)
             return ActionType.CHANGE_TEXT, {'new_text': text_after_to}
     
-    # Resize actions - enhanced for natural speech
-    resize_increase = [
-        'bigger', 'larger', 'increase size', 'make it bigger', 
-        'expand', 'grow', 'enlarge', 'increase', 'make bigger',
-        'increase the size', 'make it larger', 'make the image bigger',
-        'increase image size', 'enlarge the image', 'make image bigger'
-    ]
-    resize_decrease = [
-        'smaller', 'decrease size', 'make it smaller', 'shrink', 
-        'reduce', 'make smaller', 'decrease', 'reduce size',
-        'decrease the size', 'make it reduce', 'make the image smaller',
-        'decrease image size', 'shrink the image', 'make image smaller'
-    ]
-    
-    if any(phrase in request for phrase in resize_increase):
+    if RESIZE_INCREASE_RE.search(request):
         logger.info("Detected RESIZE (increase) action")
         return ActionType.RESIZE, {'scale_factor': 1.2}
-    elif any(phrase in request for phrase in resize_decrease):
+    elif RESIZE_DECREASE_RE.search(request):
         logger.info("Detected RESIZE (decrease) action")
         return ActionType.RESIZE, {'scale_factor': 0.8}
     
     logger.info("Could not determine action type from request")
     return None, {}
 
-def update_element_position(object_id: str, target_position: Position):
-    """Update the position of an element on the slide."""
-    service = get_slides_service()
-    
-    # Get current element properties
-    presentation = service.presentations().get(
-        presentationId=PRESENTATION_ID
-    ).execute()
-    
-    # Find the element
-    element = None
-    for slide in presentation.get('slides', []):
-        for page_element in slide.get('pageElements', []):
-            if page_element.get('objectId') == object_id:
-                element = page_element
-                break
-        if element:
-            break
+def position_requests(object_id: str, target_position: Position,
+                      page_elements: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """Build the requests that move an element to a position on the slide."""
+    if page_elements is None:
+        page_elements = _fetch_page_elements()
     
+    element = page_elements.get(object_id)
     if not element:
         raise ValueError(f"Element {object_id} not found")
     
@@ -629,10 +829,10 @@ def update_element_position(object_id: str, target_position: Position):
     if not new_pos:
         raise ValueError(f"Invalid position: {target_position}")
     
-    logger.info(f"Moving element to position: {target_position.value}")
-    logger.info(f"New coordinates: ({new_pos['x']}, {new_pos['y']})")
+    logger.info("Moving element to position: %s", target_position.value)
+    logger.info("New coordinates: (%s, %s)", new_pos['x'], new_pos['y'])
     
-    requests = [{
+    return [{
         "updatePageElementTransform": {
             "objectId": object_id,
             "transform": {
@@ -645,16 +845,18 @@ def update_element_position(object_id: str, target_position: Position):
             "applyMode": "ABSOLUTE"
         }
     }]
+
+def update_element_position(object_id: str, target_position: Position,
+                            page_elements: Optional[Dict[str, Dict[str, Any]]] = None):
+    """Update the position of an element on the slide."""
+    requests = position_requests(object_id, target_position, page_elements)
     
     try:
-        response = service.presentations().batchUpdate(
-            presentationId=PRESENTATION_ID,
-            body={"requests": requests}
-        ).execute()
-        logger.info(f"Move response: {response}")
+        response = send_batch_update(requests)
+        logger.debug("Move response: %s", response)
         return True
     except Exception as e:
-        logger.error(f"Error moving element: {str(e)}")
+        logger.error("Error moving element: %s", e)
         raise
 
 def process_text_request(request: str) -> str:
@@ -669,10 +871,14 @@ def process_text_request(request: str) -> str:
     - "Make the image bigger"
     """
     logger.info("=" * 50)
-    logger.info(f"Processing request: '{request}'")
+    logger.info("Processing request: '%s'", request)
+    request_lc = request.lower()
     
     # Get all elements from the presentation
-    elements = get_presentation_elements()
+    snapshot = get_presentation_elements()
+    elements = snapshot.elements
+    page_elements = snapshot.page_elements
+    text_elements = snapshot.by_type[ElementType.TEXT]
     if not elements:
         logger.info("No elements found in presentation")
         return "I don't see any elements in the presentation."
@@ -680,43 +886,27 @@ def process_text_request(request: str) -> str:
     # Parse the action type and parameters
     action_type, params = parse_action(request)
     
-    # Check for move/position-related keywords
-    move_keywords = ['move', 'place', 'put', 'position', 'relocate']
-    position_keywords = {
-        'bottom': Position.BOTTOM,
-        'top': Position.TOP,
-        'left': Position.LEFT,
-        'right': Position.RIGHT,
-        'center': Position.CENTER
-    }
-    
     # Handle move requests
-    if any(keyword in request.lower() for keyword in move_keywords):
+    if MOVE_KEYWORD_RE.search(request_lc):
         # Determine target position
-        target_pos = None
-        for pos_keyword, pos_value in position_keywords.items():
-            if pos_keyword in request.lower():
-                target_pos = pos_value
-                break
+        target_pos = next(
+            (pos_value for pos_keyword, pos_value in MOVE_TARGETS if pos_keyword in request_lc),
+            None
+        )
         
         if target_pos:
             # Find the element to move (prioritize title/text elements)
-            target_element = None
-            for element in elements.values():
-                if element.element_type == ElementType.TEXT:
-                    if "title" in request.lower() and "welcome to voxdeck" in element.content.lower():
-                        target_element = element
-                        break
-                    # If no specific title mentioned, use the first text element
-                    if not target_element:
-                        target_element = element
+            target_element = snapshot.title_element if "title" in request_lc else None
+            # If no specific title mentioned, use the first text element
+            if not target_element and text_elements:
+                target_element = text_elements[0]
             
             if target_element:
                 try:
-                    update_element_position(target_element.object_id, target_pos)
+                    update_element_position(target_element.object_id, target_pos, page_elements)
                     return f"Done! I've moved the text to the {target_pos.value} of the slide"
                 except Exception as e:
-                    logger.error(f"Error moving element: {str(e)}")
+                    logger.error("Error moving element: %s", e)
                     return f"Sorry, I ran into an error while moving the text: {str(e)}"
             else:
                 return "I couldn't find the text element to move"
@@ -731,17 +921,19 @@ def process_text_request(request: str) -> str:
                "- 'Make the image bigger'"
     
     # Special handling for changing all fonts
-    if action_type == ActionType.CHANGE_FONT and "all" in request.lower():
+    if action_type == ActionType.CHANGE_FONT and "all" in request_lc:
+        # Only text elements take a font; one invalid request would fail the whole batch
+        text_ids = [element.object_id for element in text_elements]
         success_count = 0
-        for element in elements.values():
+        if text_ids:
             try:
-                update_font_family(element.object_id, params['font_family'])
-                success_count += 1
+                update_font_family_bulk(text_ids, params['font_family'])
+                success_count = len(text_ids)
             except Exception as e:
-                logger.error(f"Error updating font for element {element.object_id}: {str(e)}")
+                logger.error("Error updating fonts: %s", e)
         
         if success_count > 0:
-            logger.info(f"Successfully updated font to '{params['font_family']}' for {success_count} elements")
+            logger.info("Successfully updated font to '%s' for %s elements", params['font_family'], success_count)
             return f"Done! I've updated the font to {params['font_family']} for {success_count} elements"
         else:
             return "Sorry, I wasn't able to update any fonts"
@@ -750,23 +942,19 @@ def process_text_request(request: str) -> str:
     target_element = None
     
     # Check if this is an image-related request
-    if "image" in request.lower():
+    if "image" in request_lc:
         logger.info("Looking for image element")
-        for element in elements.values():
-            if element.element_type == ElementType.IMAGE:
-                target_element = element
-                logger.info("Found image element to modify")
-                break
+        image_elements = snapshot.by_type[ElementType.IMAGE]
+        if image_elements:
+            target_element = image_elements[0]
+            logger.info("Found image element to modify")
     # Otherwise look for text elements by position
-    elif any(word in request.lower() for word in ['title', 'top', 'bottom', 'left', 'right', 'center', 'up', 'down']):
-        target_element = find_element_by_position(elements, request)
+    elif TARGET_HINT_RE.search(request_lc):
+        target_element = find_element_by_position(elements, request, snapshot)
     else:
         # Default to title if no position specified
         logger.info("No position specified, looking for title element")
-        for element in elements.values():
-            if element.element_type == ElementType.TEXT and "welcome to voxdeck" in element.content.lower():
-                target_element = element
-                break
+        target_element = snapshot.title_element
         if not target_element:
             target_element = next(iter(elements.values()))
     
@@ -777,30 +965,30 @@ def process_text_request(request: str) -> str:
     try:
         # Execute the requested action
         if action_type == ActionType.RESIZE:
-            resize_element(target_element.object_id, params['scale_factor'])
+            resize_element(target_element.object_id, params['scale_factor'], page_elements)
             action_desc = "bigger" if params['scale_factor'] > 1 else "smaller"
             element_type = "image" if target_element.element_type == ElementType.IMAGE else "text"
-            logger.info(f"Successfully made {element_type} {action_desc}")
+            logger.info("Successfully made %s %s", element_type, action_desc)
             return f"Done! I've made the {element_type} {action_desc}"
         
         elif action_type == ActionType.CHANGE_TEXT:
             update_element_text(target_element.object_id, params['new_text'])
-            logger.info(f"Successfully updated text to: '{params['new_text']}'")
+            logger.info("Successfully updated text to: '%s'", params['new_text'])
             return f"Done! I've updated the text"
         
         elif action_type == ActionType.CHANGE_FONT:
             update_font_family(target_element.object_id, params['font_family'])
-            logger.info(f"Successfully updated font to: '{params['font_family']}'")
+            logger.info("Successfully updated font to: '%s'", params['font_family'])
             return f"Done! I've updated the font to {params['font_family']}"
             
         elif action_type == ActionType.CHANGE_COLOR:
             update_text_color(target_element.object_id, params['color'])
-            color_name = next(name for name, rgb in COLORS.items() if rgb == params['color'])
-            logger.info(f"Successfully updated text color to: '{color_name}'")
+            color_name = COLOR_NAME_BY_RGB[_rgb_key(params['color'])]
+            logger.info("Successfully updated text color to: '%s'", color_name)
             return f"Done! I've updated the text color to {color_name}"
         
     except Exception as e:
-        logger.error(f"Error performing action: {str(e)}")
+        logger.error("Error performing action: %s", e)
         return f"Sorry, I ran into an error: {str(e)}"
     
     return "Done!"
@@ -0,0 +1,118 @@
+import pathlib
+import sys
+import unittest
+
+# Make the backend modules importable however the tests are launched
+BACKEND_DIR = str(pathlib.Path(__file__).resolve().parent.parent)
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+from nlp_editor import (
+    ActionType, ElementType, Position, SlideElement, SLIDE_HEIGHT, SLIDE_WIDTH,
+    find_element_by_position, get_position_from_coordinates, parse_action
+)
+
+# Relative center point of each grid cell
+_CELL_CENTERS = {
+    Position.TOP_LEFT: (0.1, 0.1),
+    Position.TOP: (0.5, 0.1),
+    Position.TOP_RIGHT: (0.9, 0.1),
+    Position.LEFT: (0.1, 0.5),
+    Position.CENTER: (0.5, 0.5),
+    Position.RIGHT: (0.9, 0.5),
+    Position.BOTTOM_LEFT: (0.1, 0.9),
+    Position.BOTTOM: (0.5, 0.9),
+    Position.BOTTOM_RIGHT: (0.9, 0.9),
+}
+
+def _element(position: Position, content: str = None) -> SlideElement:
+    """A zero-size text element at the center of the given grid cell."""
+    rel_x, rel_y = _CELL_CENTERS[position]
+    x, y = rel_x * SLIDE_WIDTH, rel_y * SLIDE_HEIGHT
+    return SlideElement(
+        object_id=position.value,
+        element_type=ElementType.TEXT,
+        content=content or f"{position.value} text",
+        x=x,
+        y=y,
+        width=0,
+        height=0,
+        page_number=1,
+        grid_position=get_position_from_coordinates(x, y, 0, 0)
+    )
+
+def _elements(*positions: Position):
+    return {element.object_id: element for element in map(_element, positions)}
+
+class FindElementByPositionTest(unittest.TestCase):
+    def test_superlatives_match_their_position(self):
+        elements = _elements(Position.TOP, Position.CENTER, Position.BOTTOM)
+
+        for request, expected in [
+            ("make the topmost text bigger", Position.TOP),
+            ("the uppermost text", Position.TOP),
+            ("the bottommost text", Position.BOTTOM),
+            ("the lowermost text", Position.BOTTOM),
+        ]:
+            with self.subTest(request=request):
+                self.assertEqual(find_element_by_position(elements, request).grid_position, expected)
+
+    def test_corners_combine_both_parts(self):
+        elements = _elements(*_CELL_CENTERS)
+
+        for request, expected in [
+            ("the top right text", Position.TOP_RIGHT),
+            ("the bottom left text", Position.BOTTOM_LEFT),
+            ("the text on the left at the bottom", Position.BOTTOM_LEFT),
+        ]:
+            with self.subTest(request=request):
+                self.assertEqual(find_element_by_position(elements, request).grid_position, expected)
+
+    def test_center_only_fills_in_a_missing_part(self):
+        elements = _elements(*_CELL_CENTERS)
+
+        for request, expected in [
+            ("the top center text", Position.TOP),
+            ("the text in the middle on the right", Position.RIGHT),
+            ("the centered text", Position.CENTER),
+        ]:
+            with self.subTest(request=request):
+                self.assertEqual(find_element_by_position(elements, request).grid_position, expected)
+
+    def test_later_keyword_overrides_earlier_one(self):
+        elements = _elements(*_CELL_CENTERS)
+
+        self.assertEqual(
+            find_element_by_position(elements, "the top, no, the bottom text").grid_position,
+            Position.BOTTOM
+        )
+        self.assertEqual(
+            find_element_by_position(elements, "the top left, sorry, right text").grid_position,
+            Position.TOP_RIGHT
+        )
+
+    def test_falls_back_to_the_general_area(self):
+        elements = _elements(Position.TOP_LEFT, Position.BOTTOM)
+
+        self.assertEqual(
+            find_element_by_position(elements, "the top text").grid_position,
+            Position.TOP_LEFT
+        )
+
+class ParseActionTest(unittest.TestCase):
+    def test_plural_font_pattern_keeps_the_whole_font_name(self):
+        # "make font" must not match inside "make fonts" and leave "s arial"
+        self.assertEqual(
+            parse_action("make fonts arial"),
+            (ActionType.CHANGE_FONT, {'font_family': 'arial'})
+        )
+
+    def test_extracted_text_is_trimmed(self):
+        for request in ["change it to ' spaced '", 'change it to " spaced "', "change it to   spaced  "]:
+            with self.subTest(request=request):
+                self.assertEqual(
+                    parse_action(request),
+                    (ActionType.CHANGE_TEXT, {'new_text': 'spaced'})
+                )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import pathlib
+import sys
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+# Make the backend modules importable however the tests are launched
+BACKEND_DIR = str(pathlib.Path(__file__).resolve().parent.parent)
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+import _slides_api
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({'status': status}), b'')
+
+class FakeRequest:
+    """A Slides request whose execute() raises each queued error, then succeeds."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {'ok': True}
+
+@mock.patch.object(_slides_api.time, 'sleep')
+class ExecuteSlidesRequestTest(unittest.TestCase):
+    def test_retries_rate_limit_then_succeeds(self, sleep):
+        request = FakeRequest(_http_error(429))
+
+        self.assertEqual(_slides_api.execute_slides_request(request), {'ok': True})
+        self.assertEqual(request.calls, 2)
+        sleep.assert_called_once()
+
+    def test_raises_after_max_retries(self, sleep):
+        request = FakeRequest(*[_http_error(503)] * _slides_api.MAX_SLIDES_RETRIES)
+
+        with self.assertRaises(HttpError):
+            _slides_api.execute_slides_request(request)
+        self.assertEqual(request.calls, _slides_api.MAX_SLIDES_RETRIES)
+        self.assertEqual(sleep.call_count, _slides_api.MAX_SLIDES_RETRIES - 1)
+
+    def test_does_not_retry_other_errors(self, sleep):
+        request = FakeRequest(_http_error(400))
+
+        with self.assertRaises(HttpError):
+            _slides_api.execute_slides_request(request)
+        self.assertEqual(request.calls, 1)
+        sleep.assert_not_called()
+
+    def test_non_idempotent_request_is_not_retried_on_unavailable(self, sleep):
+        request = FakeRequest(_http_error(503))
+
+        with self.assertRaises(HttpError):
+            _slides_api.execute_slides_request(request, retry_unavailable=False)
+        self.assertEqual(request.calls, 1)
+        sleep.assert_not_called()
+
+    def test_non_idempotent_request_is_retried_on_rate_limit(self, sleep):
+        request = FakeRequest(_http_error(429))
+
+        self.assertEqual(
+            _slides_api.execute_slides_request(request, retry_unavailable=False),
+            {'ok': True}
+        )
+        self.assertEqual(request.calls, 2)
+
+if __name__ == '__main__':
+    unittest.main()